@@ -12,14 +12,109 @@ Usage:
     python3 analyze-trace.py trace.speedscope.json [--output metrics.json] [--markdown summary.md]
 """
 
+import io
 import json
+import mmap
+import os
+import re
 import sys
 import argparse
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 
-
+# Optional accelerators. CI runs this script on a bare Python install, so
+# both imports degrade gracefully to the stdlib json path below.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+    try:
+        # The C (yajl2) backend streams several times faster than the
+        # pure-Python one; without it, streaming can be slower than a
+        # one-shot stdlib parse.
+        ijson = ijson.get_backend('yajl2_c')
+    except ImportError:
+        pass
+except ImportError:
+    ijson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# numba does heavy initialization at import time, so guard against any
+# failure mode, not just absence - a broken install must not stop analysis.
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+# Traces larger than this are streamed with ijson (when available) instead of
+# being materialized in one go, to keep peak memory bounded on multi-GB traces.
+STREAMING_THRESHOLD_BYTES = 200 * 1024 * 1024
+
+# Below this many events+samples across all profiles, forking worker
+# processes costs more than it saves and accumulation stays in-process.
+PARALLEL_MIN_EVENTS = 2_000_000
+
+
+if msgspec is not None:
+    # Typed schema for the Speedscope format. msgspec decodes straight into
+    # these C-struct-like objects: faster than a generic dict parse and with
+    # plain attribute access (no hashing) in the hot loops.
+    class TraceEvent(msgspec.Struct):
+        type: str = ''
+        frame: int = -1
+        at: float = 0.0
+
+    class TraceFrame(msgspec.Struct):
+        name: str = 'Unknown'
+
+    class TraceProfile(msgspec.Struct):
+        type: str = 'sampled'
+        name: str = ''
+        samples: list = []
+        weights: list = []
+        events: list[TraceEvent] = []
+        startValue: float = 0.0
+        endValue: float = 0.0
+
+    class TraceShared(msgspec.Struct):
+        frames: list[TraceFrame] = []
+
+    class Trace(msgspec.Struct):
+        shared: TraceShared = msgspec.field(default_factory=TraceShared)
+        profiles: list[TraceProfile] = []
+
+    _TRACE_DECODER = msgspec.json.Decoder(Trace)
+else:
+    Trace = None
+    _TRACE_DECODER = None
+
+
+@lru_cache(maxsize=1024)
 def format_duration(ms):
     """Convert milliseconds to human-readable format.
 
@@ -39,6 +134,16 @@ def format_duration(ms):
         return f"{ms / 3600000:.1f} hours"
 
 
+# Widest bar used anywhere; format_percentage_bar slices these instead of
+# building fresh strings with '*' per call.
+_BAR_FULL = '█' * 20
+_BAR_EMPTY = '░' * 20
+# All 21 bars at the default width, prebuilt once: the common case is a
+# single list index with zero string construction.
+_BAR_CACHE = [_BAR_FULL[:i] + _BAR_EMPTY[i:] for i in range(21)]
+
+
+@lru_cache(maxsize=1024)
 def format_percentage_bar(percentage, width=20):
     """Create visual progress bar for percentages.
 
@@ -46,14 +151,50 @@ def format_percentage_bar(percentage, width=20):
         40.0 -> "████████░░░░░░░░░░░░ 40.0%"
     """
     filled = int((percentage / 100.0) * width)
-    empty = width - filled
-    bar = '█' * filled + '░' * empty
+    if width == 20 and 0 <= filled <= 20:
+        return f"{_BAR_CACHE[filled]} {percentage:.1f}%"
+    if 0 <= filled <= width <= 20:
+        return f"{_BAR_FULL[:filled]}{_BAR_EMPTY[:width - filled]} {percentage:.1f}%"
+    # Out-of-range percentages or custom widths: build explicitly
+    bar = '█' * filled + '░' * (width - filled)
     return f"{bar} {percentage:.1f}%"
 
 
+# Noise: Thread management, meta-frames, unmanaged code
+NOISE_PATTERNS = [
+    'threads', 'non-activities', 'process64', 'unmanaged_code_time',
+    'threading.portablethreadpool', 'threading.lowlevellifosemaphore',
+    'threading.semaphoreslim', 'threading.monitor.wait',
+    'threading.manualreseteventslim', 'threading.thread.sleep',
+    'waithandle', 'taskawaiter'
+]
+
+# Single alternation so batch classification is one C-level scan per name
+# instead of one Python-level substring search per pattern.
+_NOISE_RE = re.compile('|'.join(re.escape(p) for p in NOISE_PATTERNS))
+
+if ahocorasick is not None:
+    # Aho-Corasick automaton: one DFA walk per name regardless of how many
+    # patterns are registered, vs the regex alternation's backtracking.
+    _NOISE_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in NOISE_PATTERNS:
+        _NOISE_AUTOMATON.add_word(_pattern, _pattern)
+    _NOISE_AUTOMATON.make_automaton()
+
+    def _is_noise(name_lower):
+        return next(_NOISE_AUTOMATON.iter(name_lower), None) is not None
+else:
+    def _is_noise(name_lower):
+        return _NOISE_RE.search(name_lower) is not None
+
+
+@lru_cache(maxsize=65536)
 def categorize_method(method_name):
     """Categorize method as app code, framework, or noise.
 
+    Memoized: traces repeat the same mangled names many times, so repeat
+    calls become a dict lookup instead of a fresh substring scan.
+
     Returns:
         'app': ProbotSharp application code
         'framework': .NET framework code (potentially interesting)
@@ -61,16 +202,7 @@ def categorize_method(method_name):
     """
     method_lower = method_name.lower()
 
-    # Noise: Thread management, meta-frames, unmanaged code
-    noise_patterns = [
-        'threads', 'non-activities', 'process64', 'unmanaged_code_time',
-        'threading.portablethreadpool', 'threading.lowlevellifosemaphore',
-        'threading.semaphoreslim', 'threading.monitor.wait',
-        'threading.manualreseteventslim', 'threading.thread.sleep',
-        'waithandle', 'taskawaiter'
-    ]
-
-    if any(pattern in method_lower for pattern in noise_patterns):
+    if _is_noise(method_lower):
         return 'noise'
 
     # App code: ProbotSharp namespaces
@@ -81,15 +213,403 @@ def categorize_method(method_name):
     return 'framework'
 
 
+def classify_frames(names_lower):
+    """Classify every (lowercased) frame name in a single batched pass.
+
+    Same categories as categorize_method, but computed once per frame up
+    front so the table-building loops do a plain list lookup per frame.
+    """
+    return [
+        'noise' if _is_noise(n)
+        else 'app' if 'probotsharp' in n
+        else 'framework'
+        for n in names_lower
+    ]
+
+
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _accumulate_evented_jit(kinds, frame_ids, timestamps, n_frames):
+        """JIT-compiled open/close stack matching over parallel event arrays.
+
+        kinds: 1 = open, 2 = close, 0 = ignore.
+        Returns (inclusive, exclusive, count, mismatches); a nonzero
+        mismatch count means the trace is not well formed and the result
+        must be discarded in favor of the conservative Python path.
+        """
+        stack_frame = np.empty(1024, np.int32)
+        stack_open = np.empty(1024, np.float64)
+        stack_child = np.empty(1024, np.float64)
+        inclusive = np.zeros(n_frames, np.float64)
+        exclusive = np.zeros(n_frames, np.float64)
+        count = np.zeros(n_frames, np.int64)
+        sp = 0
+        mismatches = 0
+        for i in range(kinds.shape[0]):
+            kind = kinds[i]
+            if kind == 1:  # Open frame
+                if sp == stack_frame.shape[0]:
+                    # Grow the stack buffers (pathologically deep traces)
+                    capacity = sp * 2
+                    new_frame = np.empty(capacity, np.int32)
+                    new_open = np.empty(capacity, np.float64)
+                    new_child = np.empty(capacity, np.float64)
+                    new_frame[:sp] = stack_frame
+                    new_open[:sp] = stack_open
+                    new_child[:sp] = stack_child
+                    stack_frame = new_frame
+                    stack_open = new_open
+                    stack_child = new_child
+                stack_frame[sp] = frame_ids[i]
+                stack_open[sp] = timestamps[i]
+                stack_child[sp] = 0.0
+                sp += 1
+            elif kind == 2 and sp > 0:  # Close frame
+                # Well-formed traces always close the frame on top of the
+                # stack, so pop unconditionally and fold the check into a
+                # branchless mismatch tally instead of guarding the pop.
+                sp -= 1
+                frame_idx = frame_ids[i]
+                mismatches += stack_frame[sp] != frame_idx
+                incl = timestamps[i] - stack_open[sp]
+                inclusive[frame_idx] += incl
+                exclusive[frame_idx] += incl - stack_child[sp]
+                count[frame_idx] += 1
+                if sp > 0:
+                    stack_child[sp - 1] += incl
+        return inclusive, exclusive, count, mismatches
+else:
+    _accumulate_evented_jit = None
+
+
+def _accumulate_evented_numpy(events, n_frames):
+    """Convert events to parallel int/float arrays and run the JIT kernel.
+
+    Returns None when the events are not in the expected shape so the caller
+    can fall back to the pure-Python loop.
+    """
+    n_events = len(events)
+    try:
+        if events and not isinstance(events[0], dict):
+            # Typed msgspec events: attribute access, no hashing
+            kinds = np.fromiter(
+                (1 if e.type == 'O' else (2 if e.type == 'C' else 0)
+                 for e in events),
+                dtype=np.uint8, count=n_events)
+            frame_ids = np.fromiter(
+                (e.frame for e in events), dtype=np.int32, count=n_events)
+            timestamps = np.fromiter(
+                (e.at for e in events), dtype=np.float64, count=n_events)
+        else:
+            kinds = np.fromiter(
+                (1 if e['type'] == 'O' else (2 if e['type'] == 'C' else 0)
+                 for e in events),
+                dtype=np.uint8, count=n_events)
+            frame_ids = np.fromiter(
+                (e['frame'] for e in events), dtype=np.int32, count=n_events)
+            timestamps = np.fromiter(
+                (e['at'] for e in events), dtype=np.float64, count=n_events)
+    except (KeyError, TypeError, ValueError):
+        return None
+    if frame_ids.min() < 0:
+        return None
+    n_frames = max(n_frames, int(frame_ids.max()) + 1)
+    inclusive, exclusive, count, mismatches = _accumulate_evented_jit(
+        kinds, frame_ids, timestamps, n_frames)
+    if mismatches:
+        return None  # malformed open/close nesting: use the Python path
+    return inclusive, exclusive, count
+
+
+def _event_triples(events):
+    """Yield (type, frame, at) for dict or typed-struct events."""
+    if events and isinstance(events[0], dict):
+        for event in events:
+            yield event.get('type'), event.get('frame'), event.get('at')
+    else:
+        for event in events:
+            yield event.type, event.frame, event.at
+
+
+def _accumulate_evented_python(events):
+    """Pure-Python open/close stack matching (fallback path)."""
+    # Track inclusive and exclusive times separately. defaultdict skips
+    # Counter's __missing__/update machinery on the per-event increments;
+    # the merge below only needs .items().
+    frame_inclusive = defaultdict(float)  # Total time in frame (incl. children)
+    frame_exclusive = defaultdict(float)  # Time in frame only (excl. children)
+    frame_count = defaultdict(int)        # Number of times frame appears
+
+    # Stack kept as three parallel lists rather than a list of tuples:
+    # crediting a closed child to its parent is then a float add on the
+    # last slot instead of a tuple rebuild per close event.
+    stack_frames = []
+    stack_opens = []
+    stack_childs = []
+
+    for event_type, frame_idx, timestamp in _event_triples(events):
+        if event_type == 'O':  # Open frame
+            stack_frames.append(frame_idx)
+            stack_opens.append(timestamp)
+            stack_childs.append(0.0)
+
+        elif event_type == 'C':  # Close frame
+            if stack_frames and stack_frames[-1] == frame_idx:
+                stack_frames.pop()
+                open_time = stack_opens.pop()
+                children_time = stack_childs.pop()
+
+                # Calculate times
+                inclusive = timestamp - open_time
+                exclusive = inclusive - children_time
+
+                # Update frame stats
+                frame_inclusive[frame_idx] += inclusive
+                frame_exclusive[frame_idx] += exclusive
+                frame_count[frame_idx] += 1
+
+                # Propagate inclusive time to parent
+                if stack_childs:
+                    stack_childs[-1] += inclusive
+
+    return frame_inclusive, frame_exclusive, frame_count
+
+
+def _accumulate_profile(profile, n_frames, frame_remap, collapse_to_noise):
+    """Accumulate one profile into per-frame totals.
+
+    Top-level (picklable) so it can run either in-process or in a worker
+    process. Returns a tuple tagged with the profile type:
+        ('sampled', counts, total_weight)  - counts is an ndarray or Counter
+        ('evented', duration, inclusive, exclusive, count)
+    """
+    is_dict = isinstance(profile, dict)
+    profile_type = profile.get('type', 'sampled') if is_dict else profile.type
+
+    if profile_type == 'evented':
+        if is_dict:
+            events = profile.get('events', [])
+            duration = profile.get('endValue', 0) - profile.get('startValue', 0)
+        else:
+            events = profile.events
+            duration = profile.endValue - profile.startValue
+
+        # JIT stack-matching kernel when numpy+numba are available;
+        # falls back to the original Python loop otherwise.
+        result = None
+        if _accumulate_evented_jit is not None and events:
+            result = _accumulate_evented_numpy(events, n_frames)
+        if result is None:
+            result = _accumulate_evented_python(events)
+        return ('evented', duration) + tuple(result)
+
+    # Sampled format: samples and weights arrays
+    if is_dict:
+        samples = profile.get('samples', [])
+        weights = profile.get('weights', [])
+    else:
+        samples = profile.samples
+        weights = profile.weights
+
+    if np is not None and len(samples):
+        # Vectorized reduction: bincount runs the whole sample->frame
+        # accumulation in one C loop instead of a Python-level iteration
+        # per sample. int32 is plenty for frame indices and halves the
+        # bytes moved versus boxed Python ints (no-op when the streaming
+        # loader already produced an int32 array).
+        s = np.asarray(samples, dtype=np.int32)
+        w = np.ones(len(s), dtype=np.float64)
+        if len(weights):
+            n_weights = min(len(weights), len(s))
+            w[:n_weights] = weights[:n_weights]
+        # Out-of-range indices fold into the noise bucket too
+        s = frame_remap[np.minimum(s, n_frames)]
+        counts = np.bincount(s, weights=w, minlength=n_frames + 1)
+        return ('sampled', counts, float(w.sum()))
+
+    # Count samples per frame (pure-Python fallback)
+    counts = defaultdict(int)  # starts at int 0, same promotion as Counter
+    total_weight = 0
+    for i, frame_idx in enumerate(samples):
+        weight = weights[i] if i < len(weights) else 1
+        total_weight += weight
+        if 0 <= frame_idx < n_frames and collapse_to_noise[frame_idx]:
+            frame_idx = n_frames
+        counts[frame_idx] += weight
+    return ('sampled', counts, total_weight)
+
+
+def _accumulate_sampled_soa(sampled, n_frames, frame_remap):
+    """Reduce many sampled profiles with one global bincount.
+
+    Samples and weights from every profile are concatenated into two flat
+    arrays (structure-of-arrays layout), so the whole accumulation is a
+    single C-level bincount over contiguous memory instead of one bincount
+    plus Python dispatch per profile.
+
+    sampled is a list of (samples, weights) pairs.
+    """
+    sample_chunks = []
+    weight_chunks = []
+    for samples, weights in sampled:
+        s = np.asarray(samples, dtype=np.int32)
+        w = np.ones(len(s), dtype=np.float64)
+        if len(weights):
+            n_weights = min(len(weights), len(s))
+            w[:n_weights] = weights[:n_weights]
+        sample_chunks.append(s)
+        weight_chunks.append(w)
+    samples_all = np.concatenate(sample_chunks)
+    weights_all = np.concatenate(weight_chunks)
+    samples_all = frame_remap[np.minimum(samples_all, n_frames)]
+    counts = np.bincount(samples_all, weights=weights_all, minlength=n_frames + 1)
+    return ('sampled', counts, float(weights_all.sum()))
+
+
+def _merge_frame_totals(total, part):
+    """Merge one profile's per-frame accumulator into the running total.
+
+    Accepts ndarray or dict accumulators (profiles fall back to the dict
+    path independently) and grows the ndarray when a later profile saw
+    higher frame indices. May take ownership of (and mutate) part.
+    """
+    part_is_dict = isinstance(part, dict)
+    if total is None:
+        if part_is_dict:
+            total = Counter()
+            total.update(part)
+            return total
+        return part
+    if isinstance(total, Counter):
+        if part_is_dict:
+            total.update(part)
+        else:
+            for frame_idx in np.nonzero(part)[0]:
+                total[int(frame_idx)] += part[frame_idx]
+        return total
+    # total is an ndarray
+    if part_is_dict:
+        highest = max(part, default=-1)
+        if highest >= len(total):
+            grown = np.zeros(highest + 1, total.dtype)
+            grown[:len(total)] = total
+            total = grown
+        for frame_idx, value in part.items():
+            total[frame_idx] += value
+        return total
+    if len(part) > len(total):
+        part[:len(total)] += total
+        return part
+    total[:len(part)] += part
+    return total
+
+
+def _should_parallelize(profiles):
+    """Fork worker processes only for multi-profile traces with real volume."""
+    if len(profiles) < 2 or (os.cpu_count() or 1) < 2:
+        return False
+    workload = sum(
+        len(p.get('events', ())) + len(p.get('samples', ()))
+        if isinstance(p, dict) else len(p.events) + len(p.samples)
+        for p in profiles)
+    return workload >= PARALLEL_MIN_EVENTS
+
+
+def top_hotspots(exclusive, k=10):
+    """Return (frame_idx, exclusive_time) pairs for the k hottest frames.
+
+    For ndarray accumulators this uses argpartition - an O(n) C-level partial
+    sort - instead of Counter.most_common's Python-level heap.
+    """
+    if np is not None and isinstance(exclusive, np.ndarray):
+        k = min(k, len(exclusive))
+        if k == 0:
+            return []
+        top_idx = np.argpartition(exclusive, -k)[-k:]
+        top_idx = top_idx[np.argsort(-exclusive[top_idx])]
+        return [(int(i), float(exclusive[i])) for i in top_idx if exclusive[i] > 0]
+    return exclusive.most_common(k)
+
+
+def load_trace(trace_path):
+    """Load a Speedscope JSON file into a dict.
+
+    Small files are parsed in one shot with orjson when available (~5x faster
+    than stdlib json). Very large traces are streamed with ijson so the raw
+    JSON text never has to coexist with the full parsed object graph.
+    """
+    path = Path(trace_path)
+
+    if ijson is not None and path.stat().st_size > STREAMING_THRESHOLD_BYTES:
+        # Two streaming passes: one for the frame table, one for the profiles.
+        # Only the parsed objects are held in memory, never the JSON text.
+        # use_float avoids Decimal objects, which the math below chokes on
+        with open(path, 'rb') as f:
+            frames = list(ijson.items(f, 'shared.frames.item', use_float=True))
+        with open(path, 'rb') as f:
+            profiles = []
+            for profile in ijson.items(f, 'profiles.item', use_float=True):
+                # Compact the boxed int/Decimal lists to ndarrays as each
+                # profile arrives, so they never all coexist as lists.
+                if np is not None:
+                    if profile.get('samples'):
+                        profile['samples'] = np.asarray(
+                            profile['samples'], dtype=np.int32)
+                    if profile.get('weights'):
+                        profile['weights'] = np.asarray(
+                            profile['weights'], dtype=np.float64)
+                profiles.append(profile)
+        return {'shared': {'frames': frames}, 'profiles': profiles}
+
+    # mmap lets the fast parsers read straight out of the page cache with
+    # no userspace copy of the raw JSON. Unmappable files (e.g. empty) and
+    # the stdlib-only case (json.loads wants bytes/str) fall back to a read.
+    raw = None
+    if orjson is not None or _TRACE_DECODER is not None:
+        try:
+            with open(path, 'rb') as f:
+                raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            raw = None
+    if raw is None:
+        raw = path.read_bytes()
+        view = None
+    else:
+        view = memoryview(raw)
+    try:
+        buf = view if view is not None else raw
+        if _TRACE_DECODER is not None:
+            try:
+                return _TRACE_DECODER.decode(buf)
+            except msgspec.ValidationError:
+                pass  # trace deviates from the schema: use generic parsing
+        if orjson is not None:
+            return orjson.loads(buf)
+        if simdjson is not None:
+            # SIMD structural parse; materialized to plain dicts because the
+            # accumulators below need dict (or msgspec struct) access.
+            return simdjson.Parser().parse(raw).as_dict()
+        return json.loads(raw)
+    finally:
+        if view is not None:
+            view.release()
+            raw.close()
+
+
 def parse_speedscope(trace_path):
     """Parse Speedscope JSON format and extract metrics."""
-    with open(trace_path, 'r') as f:
-        data = json.load(f)
+    data = load_trace(trace_path)
 
-    frames = data.get('shared', {}).get('frames', [])
-    profiles = data.get('profiles', [])
+    if Trace is not None and isinstance(data, Trace):
+        # Typed decode: frame/profile fields are attributes, no dict gets
+        frame_names = [fr.name for fr in data.shared.frames]
+        profiles = data.profiles
+    else:
+        frames = data.get('shared', {}).get('frames', [])
+        profiles = data.get('profiles', [])
+        frame_names = [f.get('name', 'Unknown') for f in frames]
 
-    if not frames or not profiles:
+    if not frame_names or not profiles:
         return {
             'error': 'Empty trace file - no frames or profiles found',
             'wall_clock_ms': 0,
@@ -98,127 +618,140 @@ def parse_speedscope(trace_path):
             'thread_count': 0
         }
 
+    # One pass over the frame table up front: lowercased names and
+    # category per frame, reused by every loop below instead of
+    # re-doing dict lookups per iteration.
+    n_frames = len(frame_names)
+    names_lower = [n.lower() for n in frame_names]
+    frame_categories = classify_frames(names_lower)
+
     # Calculate total samples/time across all profiles
     # Speedscope supports two profile types: 'sampled' and 'evented'
     total_samples = 0
     frame_samples = Counter()
-    profile_results = []  # Store per-profile metrics for evented format
-
-    for profile in profiles:
-        profile_type = profile.get('type', 'sampled')
-
-        if profile_type == 'sampled':
-            # Sampled format: samples and weights arrays
-            samples = profile.get('samples', [])
-            weights = profile.get('weights', [])
-
-            # Count samples per frame
-            for i, frame_idx in enumerate(samples):
-                weight = weights[i] if i < len(weights) else 1
-                total_samples += weight
-                frame_samples[frame_idx] += weight
-
-        elif profile_type == 'evented':
-            # Evented format: open/close events with timestamps
-            events = profile.get('events', [])
-            start_value = profile.get('startValue', 0)
-            end_value = profile.get('endValue', 0)
-
-            # Track inclusive and exclusive times separately
-            frame_inclusive = Counter()  # Total time in frame (including children)
-            frame_exclusive = Counter()  # Time in frame only (excluding children)
-            frame_count = Counter()      # Number of times frame appears
-
-            stack = []  # Stack of (frame_idx, open_time, children_time)
-
-            for event in events:
-                event_type = event.get('type')
-                frame_idx = event.get('frame')
-                timestamp = event.get('at')
-
-                if event_type == 'O':  # Open frame
-                    stack.append((frame_idx, timestamp, 0.0))
-
-                elif event_type == 'C':  # Close frame
-                    if stack and stack[-1][0] == frame_idx:
-                        _, open_time, children_time = stack.pop()
-
-                        # Calculate times
-                        inclusive = timestamp - open_time
-                        exclusive = inclusive - children_time
-
-                        # Update frame stats
-                        frame_inclusive[frame_idx] += inclusive
-                        frame_exclusive[frame_idx] += exclusive
-                        frame_count[frame_idx] += 1
-
-                        # Propagate inclusive time to parent
-                        if stack:
-                            parent_frame, parent_open, parent_children = stack[-1]
-                            stack[-1] = (parent_frame, parent_open, parent_children + inclusive)
-
-            # Calculate profile duration (Step 2)
-            profile_duration = end_value - start_value
-
-            # Store profile result for aggregation (Step 2)
-            profile_results.append({
-                'duration_ms': profile_duration,
-                'frame_inclusive': frame_inclusive,
-                'frame_exclusive': frame_exclusive,
-                'frame_count': frame_count
-            })
-
-    # Aggregate results across all profiles (Step 3)
-    if profile_results:
-        # Evented format: aggregate from profile_results
-        # Wall-clock = max duration across all threads (they run concurrently)
-        wall_clock_ms = max(p['duration_ms'] for p in profile_results)
-
-        # Aggregate frame times across all threads
-        total_inclusive = Counter()
-        total_exclusive = Counter()
-        total_count = Counter()
-
-        for result in profile_results:
-            for frame_idx, time in result['frame_inclusive'].items():
-                total_inclusive[frame_idx] += time
-            for frame_idx, time in result['frame_exclusive'].items():
-                total_exclusive[frame_idx] += time
-            for frame_idx, count in result['frame_count'].items():
-                total_count[frame_idx] += count
-
-        # Total CPU time = sum of all exclusive times
-        total_cpu_time_ms = sum(total_exclusive.values())
+    sampled_counts = None  # ndarray accumulator for the numpy fast path
+    # Evented running totals; wall_clock_ms doubles as the "saw any
+    # evented profile" flag for the format branch below.
+    wall_clock_ms = None
+    total_inclusive = None
+    total_exclusive = None
+    total_count = None
+
+    # Most dotnet-trace output is dominated by threading/wait noise frames
+    # that never reach the hotspot tables. Collapse them into a single
+    # aggregate bucket (index n_frames) before accumulation so the exact
+    # per-frame work is only spent on actionable frames; GC/alloc frames
+    # keep exact counts because the GC scan needs them.
+    is_gc = [('gc' in n) or ('garbage' in n) for n in names_lower]
+    is_alloc = ['alloc' in n for n in names_lower]
+    collapse_to_noise = [
+        category == 'noise' and not (gc or alloc)
+        for category, gc, alloc in zip(frame_categories, is_gc, is_alloc)
+    ]
+    frame_remap = None
+    if np is not None:
+        frame_remap = np.arange(n_frames + 1, dtype=np.int32)
+        frame_remap[:n_frames][np.asarray(collapse_to_noise, dtype=bool)] = n_frames
+
+    accumulate = partial(
+        _accumulate_profile, n_frames=n_frames,
+        frame_remap=frame_remap, collapse_to_noise=collapse_to_noise)
+
+    # Profiles are independent (one per thread), so big multi-profile
+    # traces fan out across worker processes and the per-frame arrays
+    # are merged below; small traces stay in-process.
+    results = None
+    if _should_parallelize(profiles):
+        try:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(accumulate, profiles, chunksize=1))
+        except Exception:
+            results = None  # pool unavailable: accumulate in-process
+    if results is None:
+        if np is not None:
+            # In-process path: batch every sampled profile into one
+            # structure-of-arrays reduction; evented profiles still go
+            # through the per-profile accumulator.
+            sampled = []
+            evented = []
+            for profile in profiles:
+                is_dict = isinstance(profile, dict)
+                profile_type = (
+                    profile.get('type', 'sampled') if is_dict else profile.type)
+                if profile_type == 'evented':
+                    evented.append(profile)
+                elif is_dict:
+                    sampled.append(
+                        (profile.get('samples', []), profile.get('weights', [])))
+                else:
+                    sampled.append((profile.samples, profile.weights))
+            results = [accumulate(p) for p in evented]
+            if sampled:
+                results.append(
+                    _accumulate_sampled_soa(sampled, n_frames, frame_remap))
+        else:
+            results = [accumulate(p) for p in profiles]
+
+    for tagged in results:
+        if tagged[0] == 'sampled':
+            _, counts, profile_total = tagged
+            total_samples += profile_total
+            if not isinstance(counts, dict):
+                if sampled_counts is None:
+                    sampled_counts = counts
+                elif len(counts) > len(sampled_counts):
+                    counts[:len(sampled_counts)] += sampled_counts
+                    sampled_counts = counts
+                else:
+                    sampled_counts[:len(counts)] += counts
+            else:
+                frame_samples.update(counts)
+        else:
+            # Evented: merge straight into the running totals instead of
+            # staging per-profile accumulators and re-walking them after.
+            _, profile_duration, frame_inclusive, frame_exclusive, frame_count = tagged
+            # Wall-clock = max duration across threads (they run concurrently)
+            if wall_clock_ms is None or profile_duration > wall_clock_ms:
+                wall_clock_ms = profile_duration
+            total_inclusive = _merge_frame_totals(total_inclusive, frame_inclusive)
+            total_exclusive = _merge_frame_totals(total_exclusive, frame_exclusive)
+            total_count = _merge_frame_totals(total_count, frame_count)
+
+    if wall_clock_ms is not None:
+        # Evented format: total CPU time = sum of all exclusive times
+        if np is not None and isinstance(total_exclusive, np.ndarray):
+            total_cpu_time_ms = float(total_exclusive.sum())
+        else:
+            total_cpu_time_ms = sum(total_exclusive.values())
     else:
         # Sampled format or empty: use old behavior for backward compatibility
         wall_clock_ms = total_samples * 1.0
         total_cpu_time_ms = total_samples * 1.0
-        total_exclusive = frame_samples
-        total_inclusive = frame_samples
+        if sampled_counts is not None:
+            total_exclusive = sampled_counts
+            total_inclusive = sampled_counts
+        else:
+            total_exclusive = frame_samples
+            total_inclusive = frame_samples
         total_count = Counter()
 
     # Get top hotspot methods (frames with most exclusive time)
-    top_frames = total_exclusive.most_common(10)
+    top_frames = top_hotspots(total_exclusive)
     top_methods = []
 
     for frame_idx, exclusive_time in top_frames:
-        if frame_idx < len(frames):
-            frame = frames[frame_idx]
-            frame_name = frame.get('name', 'Unknown')
+        if frame_idx < n_frames:
+            frame_name = frame_names[frame_idx]
 
             # Clean up frame name for readability
-            if '!' in frame_name:
-                # Format: "Assembly!Namespace.Class.Method"
-                parts = frame_name.split('!')
-                if len(parts) > 1:
-                    method_path = parts[1]
-                else:
-                    method_path = frame_name
-            else:
-                method_path = frame_name
+            # Format: "Assembly!Namespace.Class.Method" - partition scans to
+            # the first '!' only and allocates no intermediate list.
+            _, sep, tail = frame_name.partition('!')
+            method_path = tail if sep else frame_name
 
-            # Get both inclusive and exclusive times
-            inclusive_time = total_inclusive[frame_idx]
+            # Get both inclusive and exclusive times (as native Python
+            # numbers - numpy scalars are not JSON serializable)
+            inclusive_time = float(total_inclusive[frame_idx])
 
             # Calculate percentages against wall-clock duration
             inclusive_pct = (inclusive_time / wall_clock_ms * 100) if wall_clock_ms > 0 else 0
@@ -230,8 +763,8 @@ def parse_speedscope(trace_path):
                 'exclusive_ms': round(exclusive_time, 2),
                 'inclusive_pct': round(inclusive_pct, 2),
                 'exclusive_pct': round(exclusive_pct, 2),
-                'samples': total_count[frame_idx],
-                'category': categorize_method(method_path)
+                'samples': int(total_count[frame_idx]),
+                'category': frame_categories[frame_idx]
             })
 
     # Analyze threads
@@ -241,13 +774,21 @@ def parse_speedscope(trace_path):
     gc_samples = 0
     alloc_samples = 0
 
-    for frame_idx, exclusive_time in total_exclusive.items():
-        if frame_idx < len(frames):
-            frame_name = frames[frame_idx].get('name', '').lower()
-            if 'gc' in frame_name or 'garbage' in frame_name:
-                gc_samples += exclusive_time
-            if 'alloc' in frame_name:
-                alloc_samples += exclusive_time
+    if np is not None and isinstance(total_exclusive, np.ndarray):
+        # Two masked sums over the is_gc/is_alloc flags computed in the
+        # single up-front frame scan - no second pass over the names.
+        gc_mask = np.asarray(is_gc, dtype=bool)
+        alloc_mask = np.asarray(is_alloc, dtype=bool)
+        n_known = min(len(total_exclusive), n_frames)
+        gc_samples = float(total_exclusive[:n_known][gc_mask[:n_known]].sum())
+        alloc_samples = float(total_exclusive[:n_known][alloc_mask[:n_known]].sum())
+    else:
+        for frame_idx, exclusive_time in total_exclusive.items():
+            if frame_idx < n_frames:
+                if is_gc[frame_idx]:
+                    gc_samples += exclusive_time
+                if is_alloc[frame_idx]:
+                    alloc_samples += exclusive_time
 
     gc_percentage = (gc_samples / wall_clock_ms * 100) if wall_clock_ms > 0 else 0
     alloc_percentage = (alloc_samples / wall_clock_ms * 100) if wall_clock_ms > 0 else 0
@@ -261,21 +802,29 @@ def parse_speedscope(trace_path):
         'gc_percentage': round(gc_percentage, 2),
         'alloc_samples': alloc_samples,
         'alloc_percentage': round(alloc_percentage, 2),
-        'timestamp': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        # Emit the Z-suffixed form directly instead of isoformat()+replace
+        'timestamp': f"{datetime.now(timezone.utc):%Y-%m-%dT%H:%M:%S.%fZ}"
     }
 
 
-def generate_markdown(metrics, baseline=None):
-    """Generate user-friendly markdown summary of metrics."""
-    lines = []
+def write_markdown(f, metrics, baseline=None):
+    """Write the user-friendly markdown summary of metrics to a file object."""
+    # Local aliases avoid repeated global lookups in the table loops
+    _fd = format_duration
+    _fb = format_percentage_bar
 
-    if 'error' in metrics:
-        lines.append('# Performance Trace Analysis\n')
-        lines.append(f"**Error:** {metrics['error']}\n")
-        return '\n'.join(lines)
+    # Stream straight to the destination instead of accumulating
+    # fragments and re-scanning them all in a final join.
+    _w = f.write
+
+    def line(text=''):
+        _w(text)
+        _w('\n')
 
-    # ===== VERDICT & SUMMARY =====
-    lines.append('## 📊 Performance Summary\n')
+    if 'error' in metrics:
+        line('# Performance Trace Analysis\n')
+        _w(f"**Error:** {metrics['error']}\n")
+        return
 
     # Determine verdict based on baseline comparison
     verdict_emoji = '✅'
@@ -298,35 +847,31 @@ def generate_markdown(metrics, baseline=None):
             verdict_emoji = '✅'
             verdict_text = f'Performance within normal variance ({wall_pct:+.1f}%)'
 
-    lines.append(f"**Verdict:** {verdict_emoji} {verdict_text}")
-    lines.append(f"**Trace Duration:** {format_duration(metrics['wall_clock_ms'])}")
-    lines.append(f"**Test Workload:** 40 webhook requests (20 issues, 20 pull requests)\n")
-    lines.append('---\n')
-
-    # ===== KEY METRICS TABLE =====
-    lines.append('### Key Metrics\n')
-    lines.append('| Metric | Value | Visual |')
-    lines.append('|--------|-------|--------|')
-
-    # CPU Time
-    cpu_time_human = format_duration(metrics['total_cpu_time_ms'])
-    cpu_bar = format_percentage_bar(100, width=20)
-    lines.append(f"| Total CPU Time | {cpu_time_human} | `{cpu_bar}` |")
-
-    # Thread Count
-    lines.append(f"| Thread Count | {metrics['thread_count']} threads | |")
-
-    # GC Activity
     gc_pct = metrics['gc_percentage']
-    gc_bar = format_percentage_bar(min(gc_pct, 100), width=20)
     gc_status = '✅ Minimal' if gc_pct < 5 else ('⚠️ Moderate' if gc_pct < 15 else '🔴 High')
-    lines.append(f"| GC Activity | {gc_pct:.2f}% {gc_status} | `{gc_bar}` |")
 
-    lines.append('')
+    # ===== VERDICT, SUMMARY & KEY METRICS =====
+    # Static sections are emitted as single f-strings rather than dozens of
+    # per-line appends; only the tables below are built in loops.
+    line(
+        f"## 📊 Performance Summary\n\n"
+        f"**Verdict:** {verdict_emoji} {verdict_text}\n"
+        f"**Trace Duration:** {_fd(metrics['wall_clock_ms'])}\n"
+        f"**Test Workload:** 40 webhook requests (20 issues, 20 pull requests)\n\n"
+        f"---\n\n"
+        f"### Key Metrics\n\n"
+        f"| Metric | Value | Visual |\n"
+        f"|--------|-------|--------|\n"
+        f"| Total CPU Time | {_fd(metrics['total_cpu_time_ms'])} | `{_fb(100, width=20)}` |\n"
+        f"| Thread Count | {metrics['thread_count']} threads | |\n"
+        f"| GC Activity | {gc_pct:.2f}% {gc_status} | `{_fb(min(gc_pct, 100), width=20)}` |"
+    )
+
+    line('')
 
     # ===== BASELINE COMPARISON (if available) =====
     if baseline and 'cpu_time_ms' in baseline and baseline['cpu_time_ms'] > 0:
-        lines.append('### 📈 Baseline Comparison\n')
+        line('### 📈 Baseline Comparison\n')
 
         cpu_diff = metrics['cpu_time_ms'] - baseline['cpu_time_ms']
         cpu_pct = (cpu_diff / baseline['cpu_time_ms']) * 100
@@ -334,73 +879,73 @@ def generate_markdown(metrics, baseline=None):
         if cpu_diff > 0:
             trend = '↑'
             emoji = '🔴' if cpu_pct > 15 else ('⚠️' if cpu_pct > 5 else '🟡')
-            lines.append(f"{emoji} **CPU Time vs Baseline (main):** +{format_duration(abs(cpu_diff))} ({trend} +{cpu_pct:.1f}%)")
+            line(f"{emoji} **CPU Time vs Baseline (main):** +{format_duration(abs(cpu_diff))} ({trend} +{cpu_pct:.1f}%)")
         elif cpu_diff < 0:
             trend = '↓'
             emoji = '🚀'
-            lines.append(f"{emoji} **CPU Time vs Baseline (main):** -{format_duration(abs(cpu_diff))} ({trend} {cpu_pct:.1f}%)")
+            line(f"{emoji} **CPU Time vs Baseline (main):** -{format_duration(abs(cpu_diff))} ({trend} {cpu_pct:.1f}%)")
         else:
             trend = '→'
-            lines.append(f"✅ **CPU Time vs Baseline (main):** No change ({trend})")
+            line(f"✅ **CPU Time vs Baseline (main):** No change ({trend})")
 
         # Add interpretation
         if abs(cpu_pct) < 5:
-            lines.append('\n_Changes are within normal variance - no action needed._')
+            line('\n_Changes are within normal variance - no action needed._')
         elif cpu_pct > 15:
-            lines.append('\n_Significant regression detected - consider investigating hotspots below._')
+            line('\n_Significant regression detected - consider investigating hotspots below._')
 
-        lines.append('')
+        line('')
 
-    lines.append('---\n')
+    line('---\n')
 
     # ===== APPLICATION HOTSPOTS =====
     app_methods = [m for m in metrics['top_methods'] if m['category'] == 'app']
 
     if app_methods:
-        lines.append('### 🔥 Application Hotspots\n')
-        lines.append('_Top methods in ProbotSharp code consuming CPU:_\n')
-        lines.append('| Method | CPU Time | Percentage |')
-        lines.append('|--------|----------|------------|')
+        line('### 🔥 Application Hotspots\n')
+        line('_Top methods in ProbotSharp code consuming CPU:_\n')
+        line('| Method | CPU Time | Percentage |')
+        line('|--------|----------|------------|')
 
         for method in app_methods[:5]:  # Show top 5 app methods
             method_name = method['method']
             if len(method_name) > 60:
                 method_name = method_name[:57] + '...'
 
-            excl_time = format_duration(method['exclusive_ms'])
-            pct_bar = format_percentage_bar(method['exclusive_pct'], width=15)
-            lines.append(f"| `{method_name}` | {excl_time} | `{pct_bar}` |")
+            excl_time = _fd(method['exclusive_ms'])
+            pct_bar = _fb(method['exclusive_pct'], width=15)
+            line(f"| `{method_name}` | {excl_time} | `{pct_bar}` |")
 
-        lines.append('')
+        line('')
     else:
-        lines.append('### 🔥 Application Hotspots\n')
-        lines.append('_No significant application hotspots detected. Most time spent in framework/wait operations._\n')
+        line('### 🔥 Application Hotspots\n')
+        line('_No significant application hotspots detected. Most time spent in framework/wait operations._\n')
 
     # ===== FRAMEWORK METHODS (collapsible) =====
     framework_methods = [m for m in metrics['top_methods'] if m['category'] == 'framework']
 
     if framework_methods:
-        lines.append('<details>')
-        lines.append('<summary>📚 Framework Methods (click to expand)</summary>\n')
-        lines.append('| Method | CPU Time | Percentage |')
-        lines.append('|--------|----------|------------|')
+        line('<details>')
+        line('<summary>📚 Framework Methods (click to expand)</summary>\n')
+        line('| Method | CPU Time | Percentage |')
+        line('|--------|----------|------------|')
 
         for method in framework_methods[:10]:
             method_name = method['method']
             if len(method_name) > 70:
                 method_name = method_name[:67] + '...'
 
-            excl_time = format_duration(method['exclusive_ms'])
-            pct_bar = format_percentage_bar(method['exclusive_pct'], width=15)
-            lines.append(f"| `{method_name}` | {excl_time} | `{pct_bar}` |")
+            excl_time = _fd(method['exclusive_ms'])
+            pct_bar = _fb(method['exclusive_pct'], width=15)
+            line(f"| `{method_name}` | {excl_time} | `{pct_bar}` |")
 
-        lines.append('\n</details>\n')
+        line('\n</details>\n')
 
     # ===== FULL DETAILS (collapsible) =====
-    lines.append('<details>')
-    lines.append('<summary>📋 Full Method Details (all categories)</summary>\n')
-    lines.append('| Method | Category | CPU Time | Percentage |')
-    lines.append('|--------|----------|----------|------------|')
+    line('<details>')
+    line('<summary>📋 Full Method Details (all categories)</summary>\n')
+    line('| Method | Category | CPU Time | Percentage |')
+    line('|--------|----------|----------|------------|')
 
     for method in metrics['top_methods']:
         method_name = method['method']
@@ -409,24 +954,32 @@ def generate_markdown(metrics, baseline=None):
 
         category_badge = {'app': '🎯 App', 'framework': '📦 Framework', 'noise': '🔇 Noise'}
         category = category_badge.get(method['category'], method['category'])
-        excl_time = format_duration(method['exclusive_ms'])
-        pct_bar = format_percentage_bar(method['exclusive_pct'], width=12)
-        lines.append(f"| `{method_name}` | {category} | {excl_time} | `{pct_bar}` |")
+        excl_time = _fd(method['exclusive_ms'])
+        pct_bar = _fb(method['exclusive_pct'], width=12)
+        line(f"| `{method_name}` | {category} | {excl_time} | `{pct_bar}` |")
 
-    lines.append('\n</details>\n')
+    line('\n</details>\n')
 
     # ===== TECHNICAL DETAILS (collapsible) =====
-    lines.append('<details>')
-    lines.append('<summary>🔍 Technical Details</summary>\n')
-    lines.append(f"- **Wall-Clock Duration:** {metrics['wall_clock_ms']:.2f} ms")
-    lines.append(f"- **Total CPU Time:** {metrics['total_cpu_time_ms']:.2f} ms")
-    lines.append(f"- **Sample Rate:** 1ms intervals")
-    lines.append(f"- **Trace Format:** Speedscope evented")
-    lines.append(f"- **GC Samples:** {metrics['gc_samples']:,.0f} ({metrics['gc_percentage']:.2f}%)")
-    lines.append(f"- **Timestamp:** {metrics['timestamp']}")
-    lines.append('\n</details>')
+    _w(
+        f"<details>\n"
+        f"<summary>🔍 Technical Details</summary>\n\n"
+        f"- **Wall-Clock Duration:** {metrics['wall_clock_ms']:.2f} ms\n"
+        f"- **Total CPU Time:** {metrics['total_cpu_time_ms']:.2f} ms\n"
+        f"- **Sample Rate:** 1ms intervals\n"
+        f"- **Trace Format:** Speedscope evented\n"
+        f"- **GC Samples:** {metrics['gc_samples']:,.0f} ({metrics['gc_percentage']:.2f}%)\n"
+        f"- **Timestamp:** {metrics['timestamp']}\n\n"
+        f"</details>"
+    )
+
 
-    return '\n'.join(lines)
+
+def generate_markdown(metrics, baseline=None):
+    """Render the markdown summary as a string (see write_markdown)."""
+    buf = io.StringIO()
+    write_markdown(buf, metrics, baseline)
+    return buf.getvalue()
 
 
 def main():
@@ -441,25 +994,39 @@ def main():
     # Parse trace
     metrics = parse_speedscope(args.trace_file)
 
-    # Load baseline if provided
+    # Load baseline if provided; a missing file just means no comparison.
+    # Opening directly (EAFP) avoids the separate exists() stat and its
+    # check-then-open race.
     baseline = None
-    if args.baseline and Path(args.baseline).exists():
-        with open(args.baseline, 'r') as f:
-            baseline = json.load(f)
+    if args.baseline:
+        try:
+            raw = Path(args.baseline).read_bytes()
+        except FileNotFoundError:
+            pass
+        else:
+            baseline = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    # Output JSON (orjson emits bytes directly; stdlib fallback encodes)
+    if orjson is not None:
+        payload = orjson.dumps(
+            metrics,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        payload = json.dumps(metrics, indent=2).encode('utf-8')
 
-    # Output JSON
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(metrics, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(payload)
         print(f"Metrics written to {args.output}")
     else:
-        print(json.dumps(metrics, indent=2))
+        sys.stdout.write(payload.decode('utf-8'))
+        sys.stdout.write('\n')
 
     # Output markdown
     if args.markdown:
-        markdown = generate_markdown(metrics, baseline)
         with open(args.markdown, 'w') as f:
-            f.write(markdown)
+            write_markdown(f, metrics, baseline)
         print(f"Summary written to {args.markdown}")
 
 
@@ -13,12 +13,17 @@ Usage:
 """
 
 import argparse
+import asyncio
+import bisect
+import json
+import os
 import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlunparse
 
 try:
     import requests
@@ -26,6 +31,30 @@ except ImportError:
     print("Error: requests library not found. Install with: pip install requests")
     sys.exit(1)
 
+# Optional: enables concurrent verification. Without it the script falls
+# back to the sequential requests loop.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: HTTP/2 multiplexing for the sequential fallback, so every
+# github.com request shares one TLS connection.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Cap on simultaneous connections to any single host, matching the
+# connector limit, so one slow host cannot hog the global concurrency.
+PER_HOST_LIMIT = 8
+
+# Sent with every request to avoid GitHub rate limiting
+REQUEST_HEADERS = {
+    'User-Agent': 'ProbotSharp-Link-Checker/1.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+}
 
 # Placeholder patterns to skip by default (used in documentation examples)
 PLACEHOLDER_PATTERNS = [
@@ -40,68 +69,131 @@ PLACEHOLDER_PATTERNS = [
 
 
 class Colors:
-    """ANSI color codes for terminal output"""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
+    """ANSI color codes for terminal output (empty when piped, so
+    redirected logs stay plain and escape formatting costs nothing)"""
+    _enabled = sys.stdout.isatty()
+    GREEN = '\033[92m' if _enabled else ''
+    RED = '\033[91m' if _enabled else ''
+    YELLOW = '\033[93m' if _enabled else ''
+    BLUE = '\033[94m' if _enabled else ''
+    BOLD = '\033[1m' if _enabled else ''
+    RESET = '\033[0m' if _enabled else ''
+
+
+# Prebuilt per-link prefixes and separator: the color wrappers are
+# constant (and empty when piped), so hot loops format only the variable
+# parts.
+GREEN_CHECK = f"{Colors.GREEN}✓{Colors.RESET}"
+RED_X = f"{Colors.RED}✗{Colors.RESET}"
+SEP = f"{Colors.BOLD}{'=' * 70}{Colors.RESET}"
 
 
 def find_markdown_files(root_dir: Path, exclude_patterns: List[str]) -> List[Path]:
     """Find all Markdown files in the repository, excluding specified patterns."""
     markdown_files = []
 
-    for md_file in root_dir.rglob("*.md"):
-        # Check if file should be excluded
-        relative_path = md_file.relative_to(root_dir)
-        if any(pattern in str(relative_path) for pattern in exclude_patterns):
-            continue
-        markdown_files.append(md_file)
+    # Walk manually so excluded subtrees (node_modules/, .git/, ...) are
+    # pruned before descent instead of being stat'ed and filtered after.
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        rel_dir = os.path.relpath(dirpath, root_dir)
+        prefix = '' if rel_dir == '.' else rel_dir + os.sep
+        # Any file under an excluded directory would contain the pattern as
+        # a substring of its relative path, so pruning here is equivalent
+        # to the per-file check.
+        dirnames[:] = [
+            d for d in dirnames
+            if not any(pattern in prefix + d + os.sep for pattern in exclude_patterns)
+        ]
+        for filename in filenames:
+            if not filename.endswith('.md'):
+                continue
+            if any(pattern in prefix + filename for pattern in exclude_patterns):
+                continue
+            markdown_files.append(Path(dirpath, filename))
 
     return sorted(markdown_files)
 
 
-def extract_github_links(content: str) -> List[Tuple[str, int]]:
+# Master pattern covering markdown links [text](url) and bare URLs, so one
+# finditer pass over the whole file replaces two scans per line. The
+# markdown branch consumes the full [text](url) span, which also stops the
+# bare branch from re-matching a URL inside a markdown link.
+_GITHUB_LINK_PATTERN = re.compile(
+    rb'\[[^\]]+\]\((?P<md>[^)]+)\)'
+    rb'|(?:^|(?<=[\s(]))(?P<bare>https?://github\.com/[^\s)<>"\',;]+)',
+    re.MULTILINE
+)
+
+_NEWLINE_PATTERN = re.compile(rb'\n')
+
+
+def extract_github_links(content: bytes) -> List[Tuple[str, int]]:
     """
-    Extract GitHub URLs from markdown content.
+    Extract GitHub URLs from markdown content (raw UTF-8 bytes).
     Returns list of (url, line_number) tuples.
+
+    Scanning the undecoded bytes skips the up-front str allocation for the
+    whole file; only the matched URLs are decoded.
     """
     links = []
 
-    # Pattern for markdown links: [text](url) and bare URLs
-    markdown_link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    bare_url_pattern = r'(?:^|[\s(])(https?://github\.com/[^\s)<>"\',;]+)'
+    # Line numbers come from a bisect over newline offsets instead of
+    # splitting the content and rescanning line by line.
+    newline_offsets = [m.start() for m in _NEWLINE_PATTERN.finditer(content)]
 
-    lines = content.split('\n')
+    for match in _GITHUB_LINK_PATTERN.finditer(content):
+        url = match.group('md')
+        if url is not None and b'github.com' not in url:
+            continue
+        if url is None:
+            url = match.group('bare')
+        line_num = bisect.bisect(newline_offsets, match.start()) + 1
+        links.append((url.decode('utf-8'), line_num))
 
-    for line_num, line in enumerate(lines, 1):
-        # Find markdown-style links
-        for match in re.finditer(markdown_link_pattern, line):
-            url = match.group(2)
-            if 'github.com' in url:
-                links.append((url, line_num))
+    return links
 
-        # Find bare URLs
-        for match in re.finditer(bare_url_pattern, line):
-            url = match.group(1)
-            links.append((url, line_num))
 
-    return links
+def _extract_from_file(md_file: Path) -> Tuple[Path, List[Tuple[str, int]], str]:
+    """Read one file and extract its GitHub links (picklable pool worker).
+
+    Returns (file, links, error_message); error_message is empty on success.
+    """
+    try:
+        content = md_file.read_bytes()
+        return md_file, extract_github_links(content), ""
+    except Exception as e:
+        return md_file, [], str(e)
+
+
+def _extract_all(markdown_files: List[Path]):
+    """Extract links from every file, fanning out across cores when worthwhile."""
+    if len(markdown_files) >= 16:
+        try:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(_extract_from_file, markdown_files, chunksize=8))
+        except Exception:
+            pass  # pool unavailable: extract in-process
+    return [_extract_from_file(md_file) for md_file in markdown_files]
 
 
 def normalize_github_url(url: str) -> str:
     """
     Normalize GitHub URLs for verification.
-    Converts /blob/ URLs to raw.githubusercontent.com for better verification.
+    Cosmetic variants of the same page (fragment, query string, host
+    case, trailing slash) collapse to one URL so they are only fetched
+    once. GitHub returns 200 for valid blob URLs, so those are kept as
+    web URLs.
     """
     # Remove fragments and query strings for checking
     url = url.split('#')[0].split('?')[0]
 
-    # For blob URLs, we'll use the GitHub web URL directly
-    # GitHub returns 200 for valid blob URLs
-    return url
+    parsed = urlparse(url)
+    netloc = parsed.netloc.lower()
+    path = parsed.path
+    # Collapse a single trailing slash (but keep the root path)
+    if len(path) > 1 and path.endswith('/'):
+        path = path[:-1]
+    return urlunparse((parsed.scheme, netloc, path, parsed.params, '', ''))
 
 
 def is_placeholder_url(url: str, patterns: List[str]) -> bool:
@@ -113,38 +205,174 @@ def is_placeholder_url(url: str, patterns: List[str]) -> bool:
     return any(pattern.lower() in url_lower for pattern in patterns)
 
 
-def verify_url(url: str, timeout: int = 10) -> Tuple[bool, int, str]:
+def load_cache(cache_path: Path) -> Dict[str, dict]:
+    """Load the URL verification cache; missing or corrupt files mean empty."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache_path: Path, cache: Dict[str, dict]) -> None:
+    """Write the cache atomically; the cache is best-effort, so failures pass."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def open_client(timeout: int):
     """
-    Verify that a URL is accessible.
-    Returns (success, status_code, error_message).
+    Open one pooled HTTP client for the sequential path.
+    With httpx (plus the h2 extra) all github.com requests multiplex over
+    a single HTTP/2 connection; otherwise a requests.Session at least
+    reuses keep-alive connections instead of paying TCP+TLS per URL.
     """
-    try:
-        # Add headers to avoid GitHub rate limiting
-        headers = {
-            'User-Agent': 'ProbotSharp-Link-Checker/1.0',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        }
+    if httpx is not None:
+        try:
+            return httpx.Client(http2=True, headers=REQUEST_HEADERS,
+                                timeout=timeout, follow_redirects=True)
+        except ImportError:  # h2 not installed
+            return httpx.Client(headers=REQUEST_HEADERS, timeout=timeout,
+                                follow_redirects=True)
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    return session
 
-        response = requests.head(url, headers=headers, timeout=timeout, allow_redirects=True)
 
-        # GitHub sometimes returns 403 for HEAD requests, try GET
-        if response.status_code == 403:
-            response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+def verify_url(url: str, timeout: int = 10, etag: str = None, client=None) -> Tuple[bool, int, str, str]:
+    """
+    Verify that a URL is accessible, reusing `client` connections when given.
+    With a cached ETag the request is conditional, so an unchanged page
+    revalidates as a header-only 304 (already in the 200-399 success range).
+    Returns (success, status_code, error_message, response_etag).
+    """
+    headers = {'If-None-Match': etag} if etag else None
+    try:
+        # A streamed GET that is closed before the body downloads costs one
+        # round-trip and near-zero bytes. GitHub 403s HEAD requests often
+        # enough that HEAD-then-GET usually paid two round-trips.
+        if httpx is not None and isinstance(client, httpx.Client):
+            # Redirects and timeout are configured on the client
+            with client.stream('GET', url, headers=headers) as response:
+                response_etag = response.headers.get('ETag', '')
+        else:
+            requester = client if client is not None else requests
+            if client is None and headers:
+                headers = dict(REQUEST_HEADERS, **headers)
+            elif client is None:
+                headers = REQUEST_HEADERS
+            response = requester.get(
+                url, headers=headers, timeout=timeout,
+                allow_redirects=True, stream=True)
+            response_etag = response.headers.get('ETag', '')
+            response.close()
 
         # Consider 200-399 as success
         if 200 <= response.status_code < 400:
-            return (True, response.status_code, "")
+            return (True, response.status_code, "", response_etag)
         else:
-            return (False, response.status_code, f"HTTP {response.status_code}")
+            return (False, response.status_code, f"HTTP {response.status_code}", response_etag)
 
     except requests.exceptions.Timeout:
-        return (False, 0, "Timeout")
+        return (False, 0, "Timeout", "")
     except requests.exceptions.ConnectionError:
-        return (False, 0, "Connection Error")
+        return (False, 0, "Connection Error", "")
     except requests.exceptions.TooManyRedirects:
-        return (False, 0, "Too Many Redirects")
+        return (False, 0, "Too Many Redirects", "")
+    except Exception as e:
+        if httpx is not None:
+            if isinstance(e, httpx.TimeoutException):
+                return (False, 0, "Timeout", "")
+            if isinstance(e, httpx.ConnectError):
+                return (False, 0, "Connection Error", "")
+            if isinstance(e, httpx.TooManyRedirects):
+                return (False, 0, "Too Many Redirects", "")
+        return (False, 0, str(e), "")
+
+
+async def verify_url_async(
+    session: "aiohttp.ClientSession",
+    url: str,
+    etag: str = None
+) -> Tuple[bool, int, str, str]:
+    """
+    Async twin of verify_url with identical semantics.
+    Returns (success, status_code, error_message, response_etag).
+    """
+    headers = {'If-None-Match': etag} if etag else None
+    try:
+        # Streamed GET closed before the body downloads: one round-trip,
+        # near-zero bytes, and no HEAD-then-GET retry on GitHub's 403s.
+        async with session.get(url, allow_redirects=True, headers=headers) as response:
+            status = response.status
+            response_etag = response.headers.get('ETag', '')
+
+        # Consider 200-399 as success
+        if 200 <= status < 400:
+            return (True, status, "", response_etag)
+        else:
+            return (False, status, f"HTTP {status}", response_etag)
+
+    except asyncio.TimeoutError:
+        return (False, 0, "Timeout", "")
+    except aiohttp.TooManyRedirects:
+        return (False, 0, "Too Many Redirects", "")
+    except aiohttp.ClientConnectionError:
+        return (False, 0, "Connection Error", "")
     except Exception as e:
-        return (False, 0, str(e))
+        return (False, 0, str(e), "")
+
+
+async def verify_urls_concurrent(
+    urls: List[str],
+    timeout: int,
+    concurrency: int,
+    etags: Dict[str, str] = None,
+    fail_fast: bool = False
+) -> Dict[str, Tuple[bool, int, str, str]]:
+    """
+    Verify many URLs with overlapping in-flight requests.
+    With fail_fast, the first failure stops the remaining checks; URLs that
+    were never checked are absent from the result.
+    Returns {url: (success, status_code, error_message, response_etag)}.
+    """
+    etags = etags or {}
+    semaphore = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=PER_HOST_LIMIT)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    # One bounded queue per host: github.com saturating its own limit must
+    # not queue requests destined for other hosts behind it.
+    host_semaphores = {
+        host: asyncio.Semaphore(PER_HOST_LIMIT)
+        for host in {urlparse(url).netloc for url in urls}
+    }
+
+    async with aiohttp.ClientSession(
+        headers=REQUEST_HEADERS, timeout=client_timeout, connector=connector
+    ) as session:
+        async def bounded(url: str):
+            # Host slot first, then a global slot, so waiters on a busy
+            # host do not hold global permits.
+            async with host_semaphores[urlparse(url).netloc], semaphore:
+                if stop.is_set():
+                    return url, None
+                result = await verify_url_async(session, url, etags.get(url))
+            if fail_fast and not result[0]:
+                stop.set()
+            return url, result
+
+        pairs = await asyncio.gather(*(bounded(url) for url in urls))
+
+    return {url: result for url, result in pairs if result is not None}
 
 
 def main():
@@ -173,13 +401,34 @@ def main():
         '--delay',
         type=float,
         default=0.5,
-        help='Delay between requests in seconds (default: 0.5)'
+        help='Delay between requests in seconds, sequential fallback only (default: 0.5)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=20,
+        help='Maximum in-flight requests when aiohttp is available (default: 20)'
+    )
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop checking as soon as one link fails (useful in CI)'
     )
     parser.add_argument(
         '--no-skip-placeholders',
         action='store_true',
         help='Do not skip placeholder URLs (your-org, yourusername, etc.)'
     )
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=86400,
+        help='Trust cached successful results for this many seconds; 0 disables the cache (default: 86400)'
+    )
+    parser.add_argument(
+        '--cache-path',
+        help='Path of the verification cache (default: .cache/verify-github-links.json)'
+    )
 
     args = parser.parse_args()
 
@@ -201,18 +450,15 @@ def main():
     print(f"{Colors.BLUE}Extracting GitHub links...{Colors.RESET}")
     all_links: Dict[str, List[Tuple[Path, int]]] = {}  # url -> [(file, line_num), ...]
 
-    for md_file in markdown_files:
-        try:
-            content = md_file.read_text(encoding='utf-8')
-            links = extract_github_links(content)
-
-            for url, line_num in links:
-                normalized_url = normalize_github_url(url)
-                if normalized_url not in all_links:
-                    all_links[normalized_url] = []
-                all_links[normalized_url].append((md_file, line_num))
-        except Exception as e:
-            print(f"{Colors.YELLOW}Warning: Could not read {md_file}: {e}{Colors.RESET}")
+    for md_file, links, extract_error in _extract_all(markdown_files):
+        if extract_error:
+            print(f"{Colors.YELLOW}Warning: Could not read {md_file}: {extract_error}{Colors.RESET}")
+            continue
+        for url, line_num in links:
+            normalized_url = normalize_github_url(url)
+            if normalized_url not in all_links:
+                all_links[normalized_url] = []
+            all_links[normalized_url].append((md_file, line_num))
 
     unique_links = len(all_links)
     total_occurrences = sum(len(occurrences) for occurrences in all_links.values())
@@ -244,29 +490,95 @@ def main():
     failed_links: List[Tuple[str, int, str, List[Tuple[Path, int]]]] = []
     verified_count = 0
     links_to_verify = len(real_links)
-
-    for i, (url, occurrences) in enumerate(sorted(real_links.items()), 1):
-        if i > 1:
-            time.sleep(args.delay)  # Rate limiting
-
-        success, status_code, error_msg = verify_url(url, args.timeout)
+    sorted_urls = sorted(real_links)
+
+    # Recently-verified URLs are trusted from the on-disk cache so repeat
+    # runs only hit the network for unknown, stale, or failing links.
+    cache_path = Path(args.cache_path) if args.cache_path \
+        else repo_root / '.cache' / 'verify-github-links.json'
+    cache: Dict[str, dict] = {}
+    results: Dict[str, Tuple[bool, int, str]] = {}
+    if args.cache_ttl > 0:
+        cache = load_cache(cache_path)
+        now = time.time()
+        for url in sorted_urls:
+            entry = cache.get(url)
+            if (isinstance(entry, dict) and entry.get('ok')
+                    and now - entry.get('ts', 0) < args.cache_ttl):
+                results[url] = (True, entry.get('status', 200), "")
+        if results:
+            print(f"{Colors.YELLOW}Trusting {len(results)} cached result(s){Colors.RESET}")
+
+    urls_to_check = [url for url in sorted_urls if url not in results]
+    # Cached ETags turn stale-entry revalidation into conditional requests
+    # (304 with no body when the page is unchanged).
+    etags = {
+        url: cache[url]['etag'] for url in urls_to_check
+        if isinstance(cache.get(url), dict) and cache[url].get('etag')
+    }
+
+    # Verification is pure network I/O, so overlap the requests when
+    # aiohttp is installed; the connector caps per-host concurrency for
+    # politeness. Otherwise fall back to one request at a time.
+    net_results: Dict[str, Tuple[bool, int, str, str]] = {}
+    if aiohttp is not None and urls_to_check:
+        net_results = asyncio.run(verify_urls_concurrent(
+            urls_to_check, args.timeout, args.concurrency, etags, args.fail_fast))
+    else:
+        with open_client(args.timeout) as client:
+            for i, url in enumerate(urls_to_check, 1):
+                if i > 1:
+                    time.sleep(args.delay)  # Rate limiting
+                result = verify_url(url, args.timeout, etags.get(url), client)
+                net_results[url] = result
+                if args.fail_fast and not result[0]:
+                    break
+
+    for url, (success, status_code, error_msg, _) in net_results.items():
+        results[url] = (success, status_code, error_msg)
+
+    if args.cache_ttl > 0:
+        now = time.time()
+        for url, (success, status_code, _, response_etag) in net_results.items():
+            cache[url] = {
+                'ok': success,
+                'status': status_code,
+                'ts': now,
+                # A 304 can omit the ETag; keep the one we validated against
+                'etag': response_etag or etags.get(url, ''),
+            }
+        save_cache(cache_path, cache)
+
+    # Batch per-URL lines into one write per ~100 entries instead of a
+    # syscall per print.
+    out_buffer: List[str] = []
+    for i, url in enumerate(sorted_urls, 1):
+        if url not in results:
+            continue  # skipped after a --fail-fast stop
+        occurrences = real_links[url]
+        success, status_code, error_msg = results[url]
 
         if success:
             verified_count += 1
             if args.verbose:
-                print(f"{Colors.GREEN}✓{Colors.RESET} [{i}/{links_to_verify}] {url}")
+                out_buffer.append(f"{GREEN_CHECK} [{i}/{links_to_verify}] {url}\n")
                 if len(occurrences) > 1:
-                    print(f"  Found in {len(occurrences)} location(s)")
+                    out_buffer.append(f"  Found in {len(occurrences)} location(s)\n")
         else:
             failed_links.append((url, status_code, error_msg, occurrences))
-            print(f"{Colors.RED}✗{Colors.RESET} [{i}/{links_to_verify}] {url}")
-            print(f"  {Colors.RED}Error: {error_msg}{Colors.RESET}")
+            out_buffer.append(f"{RED_X} [{i}/{links_to_verify}] {url}\n")
+            out_buffer.append(f"  {Colors.RED}Error: {error_msg}{Colors.RESET}\n")
+        if len(out_buffer) >= 100:
+            sys.stdout.write(''.join(out_buffer))
+            out_buffer.clear()
+    if out_buffer:
+        sys.stdout.write(''.join(out_buffer))
 
     # Print summary
     print()
-    print(f"{Colors.BOLD}{'='*70}{Colors.RESET}")
+    print(SEP)
     print(f"{Colors.BOLD}Summary{Colors.RESET}")
-    print(f"{Colors.BOLD}{'='*70}{Colors.RESET}")
+    print(SEP)
     print(f"Total unique URLs: {unique_links}")
     print(f"Total occurrences: {total_occurrences}")
     if placeholder_links and skip_placeholders:
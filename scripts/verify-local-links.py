@@ -17,21 +17,71 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 from urllib.parse import unquote
 
+# Optional: linear-time regex engine (no catastrophic backtracking) for
+# the hot link patterns. Falls back to the stdlib backtracking engine.
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+def _compile_linear(pattern: str):
+    """Compile with re2 when available and the pattern is supported."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass  # feature not supported by this re2 build
+    return re.compile(pattern)
+
+
+# Optional: much faster content hashing for the anchor cache. blake2b is
+# the stdlib fallback; both only have to be stable within one machine.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Below this many files, forking worker processes costs more than the
+# regex work they would parallelize.
+PARALLEL_MIN_FILES = 16
+
+# Parse results persisted across runs, keyed by file path with a content
+# hash, so unchanged files skip all regex work on the next run. Loaded
+# before the worker pool forks so workers inherit it read-only.
+_PARSE_CACHE: Dict[str, dict] = {}
+
 
 class Colors:
-    """ANSI color codes for terminal output"""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
+    """ANSI color codes for terminal output (empty when piped, so
+    redirected logs stay plain and escape formatting costs nothing)"""
+    _enabled = sys.stdout.isatty()
+    GREEN = '\033[92m' if _enabled else ''
+    RED = '\033[91m' if _enabled else ''
+    YELLOW = '\033[93m' if _enabled else ''
+    BLUE = '\033[94m' if _enabled else ''
+    BOLD = '\033[1m' if _enabled else ''
+    RESET = '\033[0m' if _enabled else ''
+
+
+# Prebuilt per-link prefixes and separator: the color wrappers are
+# constant (and empty when piped), so hot loops format only the variable
+# parts.
+GREEN_CHECK = f"{Colors.GREEN}✓{Colors.RESET}"
+RED_X = f"{Colors.RED}✗{Colors.RESET}"
+YELLOW_SKIP = f"{Colors.YELLOW}⊘{Colors.RESET}"
+SEP = f"{Colors.BOLD}{'=' * 70}{Colors.RESET}"
 
 
 def github_slugify(text: str, existing_slugs: Dict[str, int]) -> str:
@@ -63,18 +113,49 @@ def github_slugify(text: str, existing_slugs: Dict[str, int]) -> str:
     # Remove leading/trailing hyphens (but keep consecutive hyphens in the middle)
     slug = slug.strip('-')
 
-    # Handle duplicates by adding -1, -2, etc.
-    base_slug = slug
-    if slug in existing_slugs:
-        count = existing_slugs[slug]
-        existing_slugs[slug] += 1
-        slug = f"{base_slug}-{count}"
-    else:
-        existing_slugs[slug] = 1
+    # Handle duplicates by adding -1, -2, etc. (single lookup per header)
+    count = existing_slugs.get(slug, 0)
+    existing_slugs[slug] = count + 1
+    if count:
+        slug = f"{slug}-{count}"
 
     return slug
 
 
+# Compiled once at module scope; extract_headers runs per file (and per
+# header for the strip pattern), so per-call re.compile/re.sub lookups add up.
+
+# ATX-style headers (# Header)
+_ATX_HEADER_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)(?:\s+#{1,6})?\s*$')
+
+# Setext-style headers (underlined with === or ---)
+_SETEXT_HEADER_PATTERN = re.compile(r'^(=+|-+)\s*$')
+
+# Inline code, links, and bold/italic emphasis, fused into one alternation
+# so each header is stripped in a single pass instead of four re.sub calls.
+_HEADER_STRIP_PATTERN = re.compile(
+    r'`[^`]+`'
+    r'|\[([^\]]+)\]\([^\)]+\)'
+    r'|\*\*([^\*]+)\*\*'
+    r'|\*([^\*]+)\*'
+)
+
+
+def _strip_header_markup(match: "re.Match") -> str:
+    """Replacement callback for _HEADER_STRIP_PATTERN."""
+    text = match.group(1) or match.group(2) or match.group(3) or ''
+    if text:
+        # Link text and emphasis bodies can themselves carry nested
+        # markup (e.g. **[text](url)**), so strip recursively
+        text = _HEADER_STRIP_PATTERN.sub(_strip_header_markup, text)
+    return text
+
+
+def _clean_header_text(header_text: str) -> str:
+    """Remove inline code, links, and other markdown formatting."""
+    return _HEADER_STRIP_PATTERN.sub(_strip_header_markup, header_text)
+
+
 def extract_headers(content: str) -> Dict[str, int]:
     """
     Extract all headers from markdown content and create anchor map.
@@ -82,117 +163,30 @@ def extract_headers(content: str) -> Dict[str, int]:
     """
     headers = {}
     slug_counts: Dict[str, int] = {}
-    lines = content.split('\n')
+    prev_line = ''
 
-    # ATX-style headers (# Header)
-    atx_pattern = re.compile(r'^(#{1,6})\s+(.+?)(?:\s+#{1,6})?\s*$')
-
-    # Setext-style headers (underlined with === or ---)
-    setext_pattern = re.compile(r'^(=+|-+)\s*$')
-
-    for i, line in enumerate(lines, 1):
+    for i, line in enumerate(content.split('\n'), 1):
         # Check ATX-style headers
-        match = atx_pattern.match(line)
+        match = _ATX_HEADER_PATTERN.match(line)
         if match:
-            header_text = match.group(2).strip()
-            # Remove inline code, links, and other markdown formatting
-            header_text = re.sub(r'`[^`]+`', '', header_text)
-            header_text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', header_text)
-            header_text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', header_text)
-            header_text = re.sub(r'\*([^\*]+)\*', r'\1', header_text)
-
+            header_text = _clean_header_text(match.group(2).strip())
             slug = github_slugify(header_text, slug_counts)
             headers[slug] = i
+            prev_line = line
             continue
 
-        # Check Setext-style headers (need to look at previous line)
+        # Check Setext-style headers (underline the preceding line)
         if i > 1:
-            match = setext_pattern.match(line)
-            if match and lines[i-2].strip():
-                header_text = lines[i-2].strip()
-                # Remove inline code, links, and other markdown formatting
-                header_text = re.sub(r'`[^`]+`', '', header_text)
-                header_text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', header_text)
-                header_text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', header_text)
-                header_text = re.sub(r'\*([^\*]+)\*', r'\1', header_text)
-
+            match = _SETEXT_HEADER_PATTERN.match(line)
+            if match and prev_line.strip():
+                header_text = _clean_header_text(prev_line.strip())
                 slug = github_slugify(header_text, slug_counts)
                 headers[slug] = i - 1
+        prev_line = line
 
     return headers
 
 
-def extract_links(content: str) -> List[Tuple[str, int, str]]:
-    """
-    Extract all local links from markdown content.
-    Returns list of (url, line_number, link_type) tuples.
-    link_type is one of: 'file', 'anchor', 'image', 'external'
-    """
-    links = []
-    lines = content.split('\n')
-
-    # Pattern for markdown links: [text](url) and images: ![alt](url)
-    inline_link_pattern = re.compile(r'(!?)\[([^\]]+)\]\(([^\)]+)\)')
-
-    # Pattern for reference-style links: [text][ref] or [text]
-    reference_link_pattern = re.compile(r'\[([^\]]+)\](?:\[([^\]]*)\])?')
-
-    # Pattern for reference definitions: [ref]: url
-    reference_def_pattern = re.compile(r'^\s*\[([^\]]+)\]:\s+(.+?)(?:\s+"[^"]*")?\s*$')
-
-    # Build reference definitions map
-    references: Dict[str, str] = {}
-    for line in lines:
-        match = reference_def_pattern.match(line)
-        if match:
-            ref_id = match.group(1).lower()
-            url = match.group(2).strip()
-            references[ref_id] = url
-
-    for line_num, line in enumerate(lines, 1):
-        # Skip reference definitions
-        if reference_def_pattern.match(line):
-            continue
-
-        # Find inline links and images
-        for match in inline_link_pattern.finditer(line):
-            is_image = match.group(1) == '!'
-            url = match.group(3).strip()
-
-            # Skip external links (handled by verify-github-links.py)
-            if url.startswith(('http://', 'https://', 'ftp://', 'mailto:')):
-                continue
-
-            # Decode URL-encoded characters
-            url = unquote(url)
-
-            link_type = 'image' if is_image else self._classify_link(url)
-            links.append((url, line_num, link_type))
-
-        # Find reference-style links (only for non-images, as reference images are rare)
-        for match in reference_link_pattern.finditer(line):
-            # Skip if it's part of a reference definition
-            if line.strip().startswith('[') and ']:' in line:
-                continue
-
-            text = match.group(1)
-            ref_id = match.group(2) if match.group(2) else text
-            ref_id = ref_id.lower()
-
-            if ref_id in references:
-                url = references[ref_id]
-
-                # Skip external links
-                if url.startswith(('http://', 'https://', 'ftp://', 'mailto:')):
-                    continue
-
-                url = unquote(url)
-                link_type = self._classify_link(url)
-                links.append((url, line_num, link_type))
-
-    return links
-
-
 def _classify_link(url: str) -> str:
     """Classify a link as 'file', 'anchor', or 'cross-doc'."""
     if url.startswith('#'):
@@ -207,20 +201,53 @@ def find_markdown_files(root_dir: Path, exclude_patterns: List[str]) -> List[Pat
     """Find all Markdown files in the repository, excluding specified patterns."""
     markdown_files = []
 
-    for md_file in root_dir.rglob("*.md"):
-        # Check if file should be excluded
-        relative_path = md_file.relative_to(root_dir)
-        if any(pattern in str(relative_path) for pattern in exclude_patterns):
-            continue
-        markdown_files.append(md_file)
+    # Walk manually so excluded subtrees (node_modules/, .git/, ...) are
+    # pruned before descent instead of being stat'ed and filtered after.
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        rel_dir = os.path.relpath(dirpath, root_dir)
+        prefix = '' if rel_dir == '.' else rel_dir + os.sep
+        # Any file under an excluded directory would contain the pattern as
+        # a substring of its relative path, so pruning here is equivalent
+        # to the per-file check.
+        dirnames[:] = [
+            d for d in dirnames
+            if not any(pattern in prefix + d + os.sep for pattern in exclude_patterns)
+        ]
+        for filename in filenames:
+            if not filename.endswith('.md'):
+                continue
+            if any(pattern in prefix + filename for pattern in exclude_patterns):
+                continue
+            markdown_files.append(Path(dirpath, filename))
 
     return sorted(markdown_files)
 
 
+def collect_repo_files(root_dir: Path) -> Set[Path]:
+    """
+    Walk the repository once and return every file and directory path.
+    Turns the per-link Path.exists() stat syscalls into set lookups.
+    """
+    repo_files: Set[Path] = set()
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        if '.git' in dirnames:
+            dirnames.remove('.git')
+        # One resolve per directory instead of one per entry
+        dir_resolved = Path(dirpath).resolve()
+        repo_files.add(dir_resolved)
+        for filename in filenames:
+            repo_files.add(dir_resolved / filename)
+    return repo_files
+
+
+@lru_cache(maxsize=None)
 def resolve_path(current_file: Path, link_path: str, root_dir: Path) -> Optional[Path]:
     """
     Resolve a relative link path from the current file.
     Returns absolute Path object or None if invalid.
+
+    Path.resolve() is a syscall-heavy realpath walk and the same relative
+    link (e.g. ../README.md) repeats across files, so results are memoized.
     """
     try:
         # Remove anchor if present
@@ -252,6 +279,67 @@ def resolve_path(current_file: Path, link_path: str, root_dir: Path) -> Optional
         return None
 
 
+def _hash_content(data: bytes) -> str:
+    """Fast, non-cryptographic content fingerprint for the parse cache."""
+    if xxhash is not None:
+        return xxhash.xxh64(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def load_parse_cache(cache_path: Path) -> Dict[str, dict]:
+    """Load the parse cache; missing or corrupt files mean empty."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_parse_cache(cache_path: Path, cache: Dict[str, dict]) -> None:
+    """Write the cache atomically; the cache is best-effort, so failures pass."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _parse_file(md_file: Path) -> Tuple[Path, Dict[str, int], List[Tuple[str, int, str]], Optional[str], Optional[str]]:
+    """Read one file and extract its anchors and links.
+
+    Top-level (picklable) so it can run either in-process or in a worker
+    process. Unchanged files (matched by content hash) are answered from
+    _PARSE_CACHE without any regex work.
+    Returns (file, headers, links, error_message, content_hash).
+    """
+    try:
+        raw = md_file.read_bytes()
+        content_hash = _hash_content(raw)
+        entry = _PARSE_CACHE.get(str(md_file))
+        if entry is not None and entry.get('hash') == content_hash:
+            links = [tuple(link) for link in entry['links']]
+            return md_file, entry['anchors'], links, None, content_hash
+        content = raw.decode('utf-8')
+        return md_file, extract_headers(content), extract_links(content), None, content_hash
+    except Exception as e:
+        return md_file, {}, [], str(e), None
+
+
+def _parse_files(markdown_files: List[Path]):
+    """Parse every file once, fanning out across cores for larger doc sets."""
+    if len(markdown_files) >= PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(_parse_file, markdown_files, chunksize=8))
+        except Exception:
+            pass  # pool unavailable: parse in-process
+    return [_parse_file(md_file) for md_file in markdown_files]
+
+
 def validate_links(
     markdown_files: List[Path],
     root_dir: Path,
@@ -265,34 +353,57 @@ def validate_links(
     failures = []
     success_count = 0
 
-    # Build header map for all files
+    # Parse every file exactly once (anchors and links together) instead
+    # of one read for the anchor map and a second for the links.
     print(f"{Colors.BLUE}Building anchor map for all files...{Colors.RESET}")
-    anchor_map: Dict[Path, Dict[str, int]] = {}
-    for md_file in markdown_files:
-        try:
-            content = md_file.read_text(encoding='utf-8')
-            anchor_map[md_file] = extract_headers(content)
-        except Exception as e:
-            print(f"{Colors.YELLOW}Warning: Could not read {md_file}: {e}{Colors.RESET}")
-            anchor_map[md_file] = {}
-
-    print(f"Built anchor map for {len(anchor_map)} files")
+    # Keyed by str(path): membership tests then hash a flat string instead
+    # of walking Path parts on every link.
+    anchor_sets: Dict[str, frozenset] = {}
+    links_by_file: Dict[Path, List[Tuple[str, int, str]]] = {}
+    cache_path = root_dir / '.cache' / 'anchors.json'
+    _PARSE_CACHE.update(load_parse_cache(cache_path))
+    new_cache: Dict[str, dict] = {}
+    for md_file, headers, links, parse_error, content_hash in _parse_files(markdown_files):
+        if parse_error is not None:
+            print(f"{Colors.YELLOW}Warning: Could not read {md_file}: {parse_error}{Colors.RESET}")
+        anchor_sets[str(md_file)] = frozenset(headers)
+        links_by_file[md_file] = links
+        if content_hash is not None:
+            new_cache[str(md_file)] = {
+                'hash': content_hash,
+                'anchors': headers,
+                'links': [list(link) for link in links],
+            }
+    save_parse_cache(cache_path, new_cache)
+
+    print(f"Built anchor map for {len(anchor_sets)} files")
     print()
 
-    # Validate links in each file
+    # Existence checks hit this set first; Path.exists() only runs as a
+    # fallback for targets the walk could not see (e.g. through symlinks).
+    repo_files = collect_repo_files(root_dir)
+
+    # Validate links in each file. Per-link lines are batched into one
+    # write per ~100 entries instead of a syscall per print.
     print(f"{Colors.BLUE}Validating local links...{Colors.RESET}")
+    out_buffer: List[str] = []
+
+    def emit(line: str) -> None:
+        out_buffer.append(line)
+        if len(out_buffer) >= 100:
+            sys.stdout.write(''.join(out_buffer))
+            out_buffer.clear()
+
     for md_file in markdown_files:
         try:
-            content = md_file.read_text(encoding='utf-8')
-            links = extract_links(content)
-
-            for url, line_num, link_type in links:
+            own_anchors = anchor_sets[str(md_file)]
+            for url, line_num, link_type in links_by_file[md_file]:
                 error = None
 
                 if link_type == 'anchor':
                     # Intra-document anchor
                     anchor = url[1:]  # Remove leading #
-                    if anchor not in anchor_map[md_file]:
+                    if anchor not in own_anchors:
                         error = f"Anchor '#{anchor}' not found in document"
 
                 elif link_type == 'file' or link_type == 'image':
@@ -300,7 +411,7 @@ def validate_links(
                     target_path = resolve_path(md_file, url, root_dir)
                     if target_path is None:
                         error = f"Invalid path: {url}"
-                    elif not target_path.exists():
+                    elif target_path not in repo_files and not target_path.exists():
                         error = f"File not found: {url}"
 
                 elif link_type == 'cross-doc':
@@ -310,40 +421,58 @@ def validate_links(
 
                     if target_path is None:
                         error = f"Invalid path: {path_part}"
-                    elif not target_path.exists():
+                    elif target_path not in repo_files and not target_path.exists():
                         error = f"File not found: {path_part}"
                     elif target_path.suffix.lower() != '.md':
                         # Non-markdown file with anchor (e.g., source code with line numbers)
                         # These are GitHub-style references (e.g., file.cs#L123)
                         # Skip validation as they're meant for GitHub's web interface
                         if verbose:
-                            print(f"{Colors.YELLOW}⊘{Colors.RESET} Skipping non-markdown anchor: {url}")
+                            emit(f"{YELLOW_SKIP} Skipping non-markdown anchor: {url}\n")
                         continue
-                    elif target_path not in anchor_map:
-                        error = f"Target file not in anchor map: {path_part}"
-                    elif anchor not in anchor_map[target_path]:
-                        error = f"Anchor '#{anchor}' not found in {path_part}"
+                    else:
+                        target_anchors = anchor_sets.get(str(target_path))
+                        if target_anchors is None:
+                            error = f"Target file not in anchor map: {path_part}"
+                        elif anchor not in target_anchors:
+                            error = f"Anchor '#{anchor}' not found in {path_part}"
 
                 if error:
                     failures.append((md_file, line_num, url, error))
                     if verbose:
                         rel_path = md_file.relative_to(root_dir)
-                        print(f"{Colors.RED}✗{Colors.RESET} {rel_path}:{line_num} - {url}")
-                        print(f"  {Colors.RED}{error}{Colors.RESET}")
+                        emit(f"{RED_X} {rel_path}:{line_num} - {url}\n")
+                        emit(f"  {Colors.RED}{error}{Colors.RESET}\n")
                 else:
                     success_count += 1
                     if verbose:
                         rel_path = md_file.relative_to(root_dir)
-                        print(f"{Colors.GREEN}✓{Colors.RESET} {rel_path}:{line_num} - {url}")
+                        emit(f"{GREEN_CHECK} {rel_path}:{line_num} - {url}\n")
 
         except Exception as e:
-            print(f"{Colors.YELLOW}Warning: Error processing {md_file}: {e}{Colors.RESET}")
+            emit(f"{Colors.YELLOW}Warning: Error processing {md_file}: {e}{Colors.RESET}\n")
+
+    if out_buffer:
+        sys.stdout.write(''.join(out_buffer))
 
     return success_count, failures
 
 
-# Fix the _classify_link reference in extract_links
-def extract_links_fixed(content: str) -> List[Tuple[str, int, str]]:
+# The link patterns run against every line of every file, so they use the
+# linear-time engine when available. The header-strip pattern stays on
+# stdlib re: its recursive replacement callback needs re.sub semantics.
+
+# Pattern for markdown links: [text](url) and images: ![alt](url)
+_INLINE_LINK_PATTERN = _compile_linear(r'(!?)\[([^\]]+)\]\(([^\)]+)\)')
+
+# Pattern for reference-style links: [text][ref] or [text]
+_REFERENCE_LINK_PATTERN = _compile_linear(r'\[([^\]]+)\](?:\[([^\]]*)\])?')
+
+# Pattern for reference definitions: [ref]: url
+_REFERENCE_DEF_PATTERN = _compile_linear(r'^\s*\[([^\]]+)\]:\s+(.+?)(?:\s+"[^"]*")?\s*$')
+
+
+def extract_links(content: str) -> List[Tuple[str, int, str]]:
     """
     Extract all local links from markdown content.
     Returns list of (url, line_number, link_type) tuples.
@@ -352,19 +481,10 @@ def extract_links_fixed(content: str) -> List[Tuple[str, int, str]]:
     links = []
     lines = content.split('\n')
 
-    # Pattern for markdown links: [text](url) and images: ![alt](url)
-    inline_link_pattern = re.compile(r'(!?)\[([^\]]+)\]\(([^\)]+)\)')
-
-    # Pattern for reference-style links: [text][ref] or [text]
-    reference_link_pattern = re.compile(r'\[([^\]]+)\](?:\[([^\]]*)\])?')
-
-    # Pattern for reference definitions: [ref]: url
-    reference_def_pattern = re.compile(r'^\s*\[([^\]]+)\]:\s+(.+?)(?:\s+"[^"]*")?\s*$')
-
     # Build reference definitions map
     references: Dict[str, str] = {}
     for line in lines:
-        match = reference_def_pattern.match(line)
+        match = _REFERENCE_DEF_PATTERN.match(line)
         if match:
             ref_id = match.group(1).lower()
             url = match.group(2).strip()
@@ -372,11 +492,11 @@ def extract_links_fixed(content: str) -> List[Tuple[str, int, str]]:
 
     for line_num, line in enumerate(lines, 1):
         # Skip reference definitions
-        if reference_def_pattern.match(line):
+        if _REFERENCE_DEF_PATTERN.match(line):
             continue
 
         # Find inline links and images
-        for match in inline_link_pattern.finditer(line):
+        for match in _INLINE_LINK_PATTERN.finditer(line):
             is_image = match.group(1) == '!'
             url = match.group(3).strip()
 
@@ -391,7 +511,7 @@ def extract_links_fixed(content: str) -> List[Tuple[str, int, str]]:
             links.append((url, line_num, link_type))
 
         # Find reference-style links (only for non-images, as reference images are rare)
-        for match in reference_link_pattern.finditer(line):
+        for match in _REFERENCE_LINK_PATTERN.finditer(line):
             # Skip if it's part of a reference definition
             if line.strip().startswith('[') and ']:' in line:
                 continue
@@ -418,10 +538,6 @@ def extract_links_fixed(content: str) -> List[Tuple[str, int, str]]:
     return links
 
 
-# Replace the original extract_links with the fixed version
-extract_links = extract_links_fixed
-
-
 def main():
     parser = argparse.ArgumentParser(
         description="Verify local links in Markdown files",
@@ -464,9 +580,9 @@ def main():
 
     # Print summary
     print()
-    print(f"{Colors.BOLD}{'='*70}{Colors.RESET}")
+    print(SEP)
     print(f"{Colors.BOLD}Summary{Colors.RESET}")
-    print(f"{Colors.BOLD}{'='*70}{Colors.RESET}")
+    print(SEP)
     print(f"{Colors.GREEN}Valid links: {success_count}{Colors.RESET}")
     print(f"{Colors.RED}Broken links: {len(failures)}{Colors.RESET}")
     print()